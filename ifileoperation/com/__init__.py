@@ -2,3 +2,4 @@ from .common import *
 from .fileoperation import *
 from .fileoperationprogresssink import *
 from .filesysbinddata import *
+from .filesysbinddata import __getattr__  # Backwards compatibility: FOLDER_BIND_CTX
@@ -3,8 +3,7 @@ __all__ = [
     'com_ptr',
 ]
 
-import struct
-from ctypes import POINTER, PyDLL, byref, c_bool, c_void_p, py_object
+from ctypes import POINTER, PyDLL, addressof, c_bool, c_void_p, py_object
 from functools import wraps
 from typing import Callable, ParamSpec, TypeVar
 
@@ -28,10 +27,13 @@ T = TypeVar('T')
 _PYCOM_PyObjectFromIUnknown = PyDLL(pythoncom.__file__).PyCom_PyObjectFromIUnknown
 _PYCOM_PyObjectFromIUnknown.restype = py_object
 _PYCOM_PyObjectFromIUnknown.argtypes = (PIUnknown, c_void_p, c_bool)
+# IUnknown._iid_ lives for the life of the process, so its address can be computed
+# once rather than building a byref() argument on every call.
+_IUNKNOWN_IID_PTR = c_void_p(addressof(IUnknown._iid_))
 
 
 def com_ptr(com_object: COMObject):
-    return _PYCOM_PyObjectFromIUnknown(com_object, byref(IUnknown._iid_), True)
+    return _PYCOM_PyObjectFromIUnknown(com_object, _IUNKNOWN_IID_PTR, True)
 
 
 _hresult_to_exception = {
@@ -66,12 +68,8 @@ def convert_exceptions(callable: Callable[P, T]) -> Callable[P, T]:
         except pythoncom.com_error as e:
             # pywin32 defines it's HRESULTS using signed integers, but all the
             # definitions online use unsigned.
-            hresult = e.hresult  # type: ignore
-            if hresult < 0:
-                hresult = struct.unpack('I', struct.pack('i', hresult))[0]
-            if hresult in _hresult_to_exception:
-                raise _hresult_to_exception[hresult](*e.args) from e
-            else:
-                raise FileOperatorError(*e.args) from e
+            hresult = e.hresult & 0xFFFFFFFF  # type: ignore
+            exception = _hresult_to_exception.get(hresult, FileOperatorError)
+            raise exception(*e.args) from e
 
     return wrapped
@@ -7,8 +7,10 @@ __all__ = [
     'FileOperationProgressSink',
 ]
 
-from functools import cached_property, wraps
-from typing import Callable, ParamSpec, overload
+from ctypes import POINTER, WINFUNCTYPE, byref, c_long, c_void_p, windll, wstring_at
+from ctypes.wintypes import DWORD
+from functools import cached_property, lru_cache
+from typing import Callable, overload
 
 from comtypes import COMObject
 from comtypes.hresult import E_FAIL, S_OK
@@ -17,7 +19,30 @@ from ..flags import FileAttributeFlags, TransferSourceFlags
 from .common import com_ptr
 from .interfaces import IFileOperationProgressSink, IShellItem
 
-P = ParamSpec('P')
+# Building a Flag from an int decomposes it into its members each time. Only a
+# handful of distinct values show up during an operation, so reuse them.
+_transfer_source_flags = lru_cache(maxsize=256)(TransferSourceFlags)
+_file_attribute_flags = lru_cache(maxsize=64)(FileAttributeFlags)
+
+_SIGDN_FILESYSPATH = 0x80058000
+_SIGDN_NORMALDISPLAY = 0
+
+# IShellItem.GetDisplayName called directly through its vtable slot (after the three
+# IUnknown methods, BindToHandler and GetParent). comtypes never CoTaskMemFree's the
+# string returned through the out parameter, leaking it on every call.
+_GetDisplayName = WINFUNCTYPE(c_long, DWORD, POINTER(c_void_p))(5, 'GetDisplayName')
+_CoTaskMemFree = WINFUNCTYPE(None, c_void_p)(('CoTaskMemFree', windll.ole32))
+
+
+def _get_display_name(item: IShellItem, sigdn: int) -> str | None:
+    """Get a display name of `item`, or None on failure."""
+    buffer = c_void_p()
+    if _GetDisplayName(item, sigdn, byref(buffer)) < 0 or not buffer:
+        return None
+    try:
+        return wstring_at(buffer.value)
+    finally:
+        _CoTaskMemFree(buffer)
 
 
 @overload
@@ -34,158 +59,278 @@ def get_name(item: IShellItem | None) -> str | None:
     """Helper to get the filename from an IShellItem"""
     if not item:
         return None
-    name = item.GetDisplayName(0x80058000)  # SIGDN_FILESYSPATH
-    if not name:
-        name = item.GetDisplayName(0)  # SIGDN_NORMALDISPLAY
-    return name
+    return _get_display_name(item, _SIGDN_FILESYSPATH) or _get_display_name(
+        item, _SIGDN_NORMALDISPLAY
+    )
 
 
-def _err_to_hresult(method: Callable[P, None]) -> Callable[P, int]:
-    @wraps(method)
-    def wrapped(*args: P.args, **kwargs: P.kwargs) -> int:
-        try:
-            method(*args, **kwargs)
-        except Exception:
-            return E_FAIL
-        return S_OK
-
-    return wrapped
+def _handler(impl: FileOperationProgressSink, name: str) -> Callable | None:
+    """Get the bound method `name` from `impl`, or None if it is the no-op version
+    from FileOperationProgressSink.
+    """
+    method = getattr(impl, name)
+    if getattr(method, '__func__', None) is getattr(FileOperationProgressSink, name):
+        return None
+    return method
 
 
 class _FileOperationProgressSink(COMObject):
     """Implementation of IFileOperationProgressSink, passes along calls to the
     Python implementation class FileOperationProgressSink.
+
+    Each method takes `this` as its first argument, which makes comtypes call it
+    directly with the raw arguments and return its result as the HRESULT.
     """
 
     _com_interfaces_ = [IFileOperationProgressSink]
 
     def __init__(self, impl: FileOperationProgressSink):
         self.impl = impl
+        self._names: dict[IShellItem, str] = {}
+        # Bind the implementation's methods once, instead of looking them up through
+        # `self.impl` on every callback. Methods left as the no-op base versions are
+        # None, so their callbacks return without converting any arguments.
+        self._start_operations = _handler(impl, 'start_operations')
+        self._finish_operations = _handler(impl, 'finish_operations')
+        self._pre_rename_item = _handler(impl, 'pre_rename_item')
+        self._post_rename_item = _handler(impl, 'post_rename_item')
+        self._pre_move_item = _handler(impl, 'pre_move_item')
+        self._post_move_item = _handler(impl, 'post_move_item')
+        self._pre_copy_item = _handler(impl, 'pre_copy_item')
+        self._post_copy_item = _handler(impl, 'post_copy_item')
+        self._pre_delete_item = _handler(impl, 'pre_delete_item')
+        self._post_delete_item = _handler(impl, 'post_delete_item')
+        self._pre_new_item = _handler(impl, 'pre_new_item')
+        self._post_new_item = _handler(impl, 'post_new_item')
+        self._update_progress = _handler(impl, 'update_progress')
+        self._reset_timer = _handler(impl, 'reset_timer')
+        self._pause_timer = _handler(impl, 'pause_timer')
+        self._resume_timer = _handler(impl, 'resume_timer')
+        # Post* callbacks only get a cache hit for their source item if the matching
+        # Pre* callback is handled, otherwise caching would just hold a reference to
+        # every source item until FinishOperations.
+        self._rename_source_name = self._name_getter(self._pre_rename_item)
+        self._move_source_name = self._name_getter(self._pre_move_item)
+        self._copy_source_name = self._name_getter(self._pre_copy_item)
+        self._delete_source_name = self._name_getter(self._pre_delete_item)
+
+    def _name_getter(self, pre_handler: Callable | None) -> Callable:
+        """Name lookup for the source item of a Post* callback."""
+        return get_name if pre_handler is None else self._get_name
+
+    def _get_name(self, item: IShellItem | None) -> str | None:
+        """Cached `get_name`, so the Pre* and Post* callbacks for the same item only
+        query the shell once. comtypes hashes interface pointers by address, and the
+        cache holds a reference to each item, so an address cannot be reused by a
+        different item until the cache is cleared in FinishOperations.
+
+        Only use this for items that are seen more than once (destination folders, and
+        sources with a Pre* handler). Newly created items are reported once, so caching
+        them would only grow the cache.
+        """
+        if not item:
+            return None
+        try:
+            return self._names[item]
+        except KeyError:
+            name = self._names[item] = get_name(item)
+            return name
+
+    def StartOperations(self, this) -> int:
+        if self._start_operations is None:
+            return S_OK
+        try:
+            self._start_operations()
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
-    def StartOperations(self):
-        self.impl.start_operations()
-
-    @_err_to_hresult
-    def FinishOperations(self, hresult: int):
-        self.impl.finish_operations(hresult)
+    def FinishOperations(self, this, hresult: int) -> int:
+        self._names.clear()
+        if self._finish_operations is None:
+            return S_OK
+        try:
+            self._finish_operations(hresult)
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
-    def PreRenameItem(self, dwFlags: int, psiItem: IShellItem, pszNewName: str):
-        self.impl.pre_rename_item(
-            TransferSourceFlags(dwFlags), get_name(psiItem), pszNewName
-        )
+    def PreRenameItem(
+        self, this, dwFlags: int, psiItem: IShellItem, pszNewName: str
+    ) -> int:
+        if self._pre_rename_item is None:
+            return S_OK
+        try:
+            self._pre_rename_item(
+                _transfer_source_flags(dwFlags), self._get_name(psiItem), pszNewName
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
     def PostRenameItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         pszNewName: str,
         hrRename: int,
         psiNewlyCreated: IShellItem | None,
-    ):
-        self.impl.post_rename_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiItem),
-            get_name(psiNewlyCreated),
-            hrRename,
-        )
-
-    @_err_to_hresult
+    ) -> int:
+        if self._post_rename_item is None:
+            return S_OK
+        try:
+            self._post_rename_item(
+                _transfer_source_flags(dwFlags),
+                self._rename_source_name(psiItem),
+                get_name(psiNewlyCreated),
+                hrRename,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
     def PreMoveItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         psiDestinationFolder: IShellItem,
         pszNewName: str,
-    ):
-        self.impl.pre_move_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiItem),
-            get_name(psiDestinationFolder),
-            pszNewName,
-        )
-
-    @_err_to_hresult
+    ) -> int:
+        if self._pre_move_item is None:
+            return S_OK
+        try:
+            self._pre_move_item(
+                _transfer_source_flags(dwFlags),
+                self._get_name(psiItem),
+                self._get_name(psiDestinationFolder),
+                pszNewName,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
     def PostMoveItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         psiDestinationFolder: IShellItem,
         pszNewName: str,
         hrMove: int,
         psiNewlyCreated: IShellItem | None,
-    ):
-        self.impl.post_move_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiItem),
-            get_name(psiDestinationFolder),
-            get_name(psiNewlyCreated),
-            hrMove,
-        )
-
-    @_err_to_hresult
+    ) -> int:
+        if self._post_move_item is None:
+            return S_OK
+        try:
+            self._post_move_item(
+                _transfer_source_flags(dwFlags),
+                self._move_source_name(psiItem),
+                self._get_name(psiDestinationFolder),
+                get_name(psiNewlyCreated),
+                hrMove,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
     def PreCopyItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         psiDestinationFolder: IShellItem,
         pszNewName: str,
-    ):
-        self.impl.pre_copy_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiItem),
-            get_name(psiDestinationFolder),
-            pszNewName,
-        )
-
-    @_err_to_hresult
+    ) -> int:
+        if self._pre_copy_item is None:
+            return S_OK
+        try:
+            self._pre_copy_item(
+                _transfer_source_flags(dwFlags),
+                self._get_name(psiItem),
+                self._get_name(psiDestinationFolder),
+                pszNewName,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
     def PostCopyItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         psiDestinationFolder: IShellItem,
         pszNewName: str,
         hrCopy: int,
         psiNewlyCreated: IShellItem | None,
-    ):
-        self.impl.post_copy_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiItem),
-            get_name(psiDestinationFolder),
-            get_name(psiNewlyCreated),
-            hrCopy,
-        )
-
-    @_err_to_hresult
-    def PreDeleteItem(self, dwFlags: int, psiItem: IShellItem):
-        self.impl.pre_delete_item(TransferSourceFlags(dwFlags), get_name(psiItem))
-
-    @_err_to_hresult
+    ) -> int:
+        if self._post_copy_item is None:
+            return S_OK
+        try:
+            self._post_copy_item(
+                _transfer_source_flags(dwFlags),
+                self._copy_source_name(psiItem),
+                self._get_name(psiDestinationFolder),
+                get_name(psiNewlyCreated),
+                hrCopy,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
+    def PreDeleteItem(self, this, dwFlags: int, psiItem: IShellItem) -> int:
+        if self._pre_delete_item is None:
+            return S_OK
+        try:
+            self._pre_delete_item(
+                _transfer_source_flags(dwFlags), self._get_name(psiItem)
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
+
     def PostDeleteItem(
         self,
+        this,
         dwFlags: int,
         psiItem: IShellItem,
         hrDelete: int,
         psiNewlyCreated: IShellItem | None,
-    ):
-        recycled = False if not psiNewlyCreated else True
-        self.impl.post_delete_item(
-            TransferSourceFlags(dwFlags), get_name(psiItem), hrDelete, recycled
-        )
+    ) -> int:
+        if self._post_delete_item is None:
+            return S_OK
+        recycled = bool(psiNewlyCreated)
+        try:
+            self._post_delete_item(
+                _transfer_source_flags(dwFlags),
+                self._delete_source_name(psiItem),
+                hrDelete,
+                recycled,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
     def PreNewItem(
-        self, dwFlags: int, psiDestinationFolder: IShellItem, pszNewName: str
-    ):
-        self.impl.pre_new_item(
-            TransferSourceFlags(dwFlags), get_name(psiDestinationFolder), pszNewName
-        )
+        self, this, dwFlags: int, psiDestinationFolder: IShellItem, pszNewName: str
+    ) -> int:
+        if self._pre_new_item is None:
+            return S_OK
+        try:
+            self._pre_new_item(
+                _transfer_source_flags(dwFlags),
+                self._get_name(psiDestinationFolder),
+                pszNewName,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
     def PostNewItem(
         self,
+        this,
         dwFlags: int,
         psiDestinationFolder: IShellItem,
         pszNewName: str,
@@ -193,26 +338,56 @@ class _FileOperationProgressSink(COMObject):
         dwFileAttributes: int,
         hrNew: int,
         psiNewItem: IShellItem | None,
-    ):
-        self.impl.post_new_item(
-            TransferSourceFlags(dwFlags),
-            get_name(psiDestinationFolder),
-            get_name(psiNewItem),
-            FileAttributeFlags(dwFileAttributes),
-            hrNew,
-        )
+    ) -> int:
+        if self._post_new_item is None:
+            return S_OK
+        try:
+            self._post_new_item(
+                _transfer_source_flags(dwFlags),
+                self._get_name(psiDestinationFolder),
+                get_name(psiNewItem),
+                _file_attribute_flags(dwFileAttributes),
+                hrNew,
+            )
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
-    def UpdateProgress(self, iWorkTotal: int, iWorkSoFar: int):
-        self.impl.update_progress(iWorkTotal, iWorkSoFar)
+    def UpdateProgress(self, this, iWorkTotal: int, iWorkSoFar: int) -> int:
+        if self._update_progress is None:
+            return S_OK
+        try:
+            self._update_progress(iWorkTotal, iWorkSoFar)
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
-    def ResetTimer(self):
-        self.impl.reset_timer()
+    def ResetTimer(self, this) -> int:
+        if self._reset_timer is None:
+            return S_OK
+        try:
+            self._reset_timer()
+        except Exception:
+            return E_FAIL
+        return S_OK
+
+    def PauseTimer(self, this) -> int:
+        if self._pause_timer is None:
+            return S_OK
+        try:
+            self._pause_timer()
+        except Exception:
+            return E_FAIL
+        return S_OK
 
-    @_err_to_hresult
-    def PauseTimer(self):
-        self.impl.pause_timer()
+    def ResumeTimer(self, this) -> int:
+        if self._resume_timer is None:
+            return S_OK
+        try:
+            self._resume_timer()
+        except Exception:
+            return E_FAIL
+        return S_OK
 
 
 class FileOperationProgressSink:
@@ -231,8 +406,10 @@ class FileOperationProgressSink:
     checking `new_name` for None.
 
     The `result` parameter is a WIN32 HRESULT value indicating the result of the
-    operation. Currently, you should only need to check this for post_delete_item, as
-    there is no good way to check for success otherwise.
+    operation.  Like pywin32, HRESULTs are passed as signed ints: mask error codes with
+    0xFFFFFFFF before comparing them against FileOperationResult.  Currently, you should
+    only need to check this for post_delete_item, as there is no good way to check for
+    success otherwise.
     """
 
     @cached_property
@@ -1,11 +1,11 @@
 __all__ = [
-    'FOLDER_BIND_CTX',
+    'folder_bind_ctx',
     'filename_to_IShellItem',
     'filenames_to_IShellItemArray',
 ]
 import os
 from collections.abc import Iterable
-from ctypes import byref
+from ctypes import pointer
 from ctypes.wintypes import DWORD, WIN32_FIND_DATAW
 from typing import TypeAlias
 
@@ -21,6 +21,12 @@ from .interfaces import IFileSysBindData
 
 StrPath: TypeAlias = str | os.PathLike[str]
 
+IID_IShellItem = shell.IID_IShellItem  # type: ignore
+# Module level bindings, avoiding attribute lookups on `shell` per parsed path.
+_SHCreateItemFromParsingName = shell.SHCreateItemFromParsingName
+_SHParseDisplayName = shell.SHParseDisplayName
+_SHCreateShellItemArrayFromIDLists = shell.SHCreateShellItemArrayFromIDLists
+
 
 class FileSysBindData(COMObject):
     """Implement the IFileSysBindData interface"""
@@ -28,40 +34,57 @@ class FileSysBindData(COMObject):
     _com_interfaces_ = [IFileSysBindData]
 
     def SetFindData(self, pfd) -> int:
-        self.find_data = pfd
+        # Copy: the caller's structure is only guaranteed valid for this call.
+        self.find_data = WIN32_FIND_DATAW.from_buffer_copy(pfd.contents)
         return S_OK
 
-    def GetFindData(self, ppfd) -> int:
-        ppfd.contents = self.find_data
-        return S_OK
+    def GetFindData(self) -> WIN32_FIND_DATAW:
+        # `pfd` is an out parameter: comtypes copies the returned structure into the
+        # caller's buffer.
+        return self.find_data
 
 
 def create_bind_ctx(find_data: WIN32_FIND_DATAW):
     """Create an IBindCtx instance with a custom WIN32_FIND_DATA structure."""
     # NOTE: Need the type-hint because of COMObject's __new__ method return types
     bind_data: FileSysBindData = FileSysBindData()
-    bind_data.SetFindData(byref(find_data))
+    bind_data.SetFindData(pointer(find_data))
     bind_ctx = pythoncom.CreateBindCtx()
     bind_ctx.RegisterObjectParam('File System Bind Data', com_ptr(bind_data))
     return bind_ctx
 
 
-FOLDER_BIND_CTX = create_bind_ctx(WIN32_FIND_DATAW(DWORD(FileAttributeFlags.DIRECTORY)))
+def folder_bind_ctx():
+    """Create an IBindCtx describing a directory, used to parse paths that don't exist
+    yet. Like any COM object, it belongs to the calling thread's apartment.
+    """
+    return create_bind_ctx(WIN32_FIND_DATAW(DWORD(FileAttributeFlags.DIRECTORY)))
+
+
+def __getattr__(name: str):
+    # Backwards compatibility: FOLDER_BIND_CTX used to be created on import, now a new
+    # context is created in the caller's apartment.
+    if name == 'FOLDER_BIND_CTX':
+        return folder_bind_ctx()
+    raise AttributeError(name)
 
 
-E_FILE_NOT_FOUND = (-2147024894, -2147024893)
+E_FILE_NOT_FOUND = frozenset((-2147024894, -2147024893))
 
 
-def filename_to_IShellItem(path: StrPath, force: bool = False):
+def filename_to_IShellItem(path: StrPath, force: bool = False, bind_ctx=None):
     """Parse a filename into an IShellItem instance. If `force` is True, then an
-    IShellItem instance will be returned even if the file does not exist.
+    IShellItem instance will be returned even if the file does not exist, parsing it
+    as a directory. A context from `folder_bind_ctx` can be passed as `bind_ctx` to
+    reuse it for multiple forced parses.
     """
-    path = os.path.abspath(os.fspath(path))
-    ctx = FOLDER_BIND_CTX if force else None
+    path = os.path.abspath(path)
+    if force:
+        ctx = folder_bind_ctx() if bind_ctx is None else bind_ctx
+    else:
+        ctx = None
     try:
-        return shell.SHCreateItemFromParsingName(
-            path, ctx, shell.IID_IShellItem  # type: ignore
-        )
+        return _SHCreateItemFromParsingName(path, ctx, IID_IShellItem)
     except pywintypes.com_error as e:
         if e.hresult in E_FILE_NOT_FOUND:  # type: ignore
             raise FileNotFoundError(path) from None
@@ -74,13 +97,16 @@ def filenames_to_IShellItemArray(paths: Iterable[StrPath]):
     returned (and indicates the operation would fail).
     """
     idls = []
+    # Bind everything used per path to locals, batches may hold thousands of paths.
+    abspath = os.path.abspath
+    parse = _SHParseDisplayName
+    append = idls.append
     for path in paths:
-        path = os.path.abspath(os.fspath(path))
+        path = abspath(path)
         try:
-            idl = shell.SHParseDisplayName(path, 0, None)[0]
+            append(parse(path, 0, None)[0])
         except pywintypes.com_error as e:
             if e.hresult in E_FILE_NOT_FOUND:  # type: ignore
                 raise FileNotFoundError(path) from None
             raise
-        idls.append(idl)
-    return None if not idls else shell.SHCreateShellItemArrayFromIDLists(idls)
+    return None if not idls else _SHCreateShellItemArrayFromIDLists(idls)
@@ -118,6 +118,5 @@ if TYPE_CHECKING:
 
     IFileOperation: TypeAlias = _make(shell.SHCreateItemFromParsingName)  # type: ignore
 else:
-    from typing import NewType
-
-    IFileOperation = NewType('IFileOperation', object)
+    # Only used as a type hint at runtime
+    IFileOperation = object
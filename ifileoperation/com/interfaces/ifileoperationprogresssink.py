@@ -17,6 +17,8 @@ class IFileOperationProgressSink(IUnknown):
     """
 
     _iid_ = GUID('{04b0f1a7-9490-44bc-96e1-4296a31252e2}')
+    # NOTE: The hr* parameters are declared as c_long rather than HRESULT, so ctypes
+    # passes them to the callbacks as plain ints instead of HRESULT instances.
     _methods_ = [
         COMMETHOD([], HRESULT, 'StartOperations'),
         COMMETHOD([], HRESULT, 'FinishOperations', (['in'], c_long, 'hrResult')),
@@ -35,7 +37,7 @@ class IFileOperationProgressSink(IUnknown):
             (['in'], DWORD, 'dwFlags'),
             (['in'], PIShellItem, 'psiItem'),
             (['string', 'in'], LPCWSTR, 'pszNewName'),
-            (['in'], HRESULT, 'hrRename'),
+            (['in'], c_long, 'hrRename'),
             (['in'], PIShellItem, 'psiNewlyCreated'),
         ),
         COMMETHOD(
@@ -75,7 +77,7 @@ class IFileOperationProgressSink(IUnknown):
             (['in'], PIShellItem, 'psiItem'),
             (['in'], PIShellItem, 'psiDestinationFolder'),
             (['string', 'unique', 'in'], LPCWSTR, 'pszNewName'),
-            (['in'], HRESULT, 'hrCopy'),
+            (['in'], c_long, 'hrCopy'),
             (['in'], PIShellItem, 'psiNewlyCreated'),
         ),
         COMMETHOD(
@@ -91,7 +93,7 @@ class IFileOperationProgressSink(IUnknown):
             'PostDeleteItem',
             (['in'], DWORD, 'dwFlags'),
             (['in'], PIShellItem, 'psiItem'),
-            (['in'], HRESULT, 'hrDelete'),
+            (['in'], c_long, 'hrDelete'),
             (['in'], PIShellItem, 'psiNewlyCreated'),
         ),
         COMMETHOD(
@@ -111,7 +113,7 @@ class IFileOperationProgressSink(IUnknown):
             (['string', 'unique', 'in'], LPCWSTR, 'pszNewName'),
             (['string', 'unique', 'in'], LPCWSTR, 'pszTemplateName'),
             (['in'], DWORD, 'dwFileAttributes'),
-            (['in'], HRESULT, 'hrNew'),
+            (['in'], c_long, 'hrNew'),
             (['in'], PIShellItem, 'psiNewItem'),
         ),
         COMMETHOD(
@@ -2,7 +2,6 @@ __all__ = [
     'IFileSysBindData',
 ]
 
-from ctypes import POINTER
 from ctypes.wintypes import PWIN32_FIND_DATAW
 
 from comtypes import COMMETHOD, GUID, HRESULT, IUnknown
@@ -17,7 +16,5 @@ class IFileSysBindData(IUnknown):
     _iid_ = GUID('{01e18d10-4d8b-11d2-855d-006008059367}')
     _methods_ = [
         COMMETHOD([], HRESULT, 'SetFindData', (['in'], PWIN32_FIND_DATAW, 'pfd')),
-        COMMETHOD(
-            [], HRESULT, 'GetFindData', (['out'], POINTER(PWIN32_FIND_DATAW), 'ppfd')
-        ),
+        COMMETHOD([], HRESULT, 'GetFindData', (['out'], PWIN32_FIND_DATAW, 'pfd')),
     ]
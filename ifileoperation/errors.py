@@ -7,12 +7,10 @@ __all__ = [
     'IFO_NotADirectoryError',
 ]
 
-import struct
-
 
 def int32_to_uint32(value: int) -> int:
     """pythoncom defines its HRESULTs as signed integers for some reason."""
-    return struct.unpack('I', struct.pack('i', value))[0]
+    return value & 0xFFFFFFFF
 
 
 class IFileOperationError(Exception):
@@ -3,7 +3,7 @@ __all__ = [
 ]
 
 from os import PathLike, fspath
-from pathlib import Path
+from os.path import abspath, dirname, normpath, split
 from typing import Iterable, TypeAlias
 
 import pythoncom
@@ -14,12 +14,16 @@ from .com import (
     convert_exceptions,
     filename_to_IShellItem,
     filenames_to_IShellItemArray,
+    folder_bind_ctx,
 )
-from .errors import IFileOperationError, UnexpectedError
+from .errors import IFileOperationError
 from .flags import FileOperationFlags, FileOperationResult, TransferSourceFlags
 
 StrPath: TypeAlias = str | PathLike[str]
 
+# Plain int, so the per-item comparison in the sink skips the enum member lookup
+_SUCCESS = FileOperationResult.SUCCESS.value
+
 
 class ProgressSink(FileOperationProgressSink):
     """ProgressSink that logs successful operations."""
@@ -48,7 +52,7 @@ class ProgressSink(FileOperationProgressSink):
         result: int,
         recycled: bool,
     ) -> None:
-        if result == FileOperationResult.SUCCESS:
+        if result == _SUCCESS:
             if recycled:
                 self.name_map[source] = 'RECYCLE_BIN'
             else:
@@ -79,6 +83,23 @@ class ProgressSink(FileOperationProgressSink):
 class FileOperator:
     """A context manager for performing file operations.  Not reentrant."""
 
+    __slots__ = (
+        'ifo',
+        'sink',
+        'sink_cookie',
+        'commit_on_exit',
+        'results',
+        'return_code',
+        'aborted',
+        '_parent',
+        '_flags',
+        '_track_results',
+        '_destinations',
+        '_bind_ctx',
+        '_operations_queued',
+        '__weakref__',
+    )
+
     DEFAULT_FLAGS = None
     """Default file operation behavior. File operations behave just as if the user had
     performed them in Windows Explorer with no modifiers (eg: Shift, Ctrl, etc).
@@ -118,9 +139,10 @@ class FileOperator:
     def __init__(
         self,
         parent=None,
-        flags: FileOperationFlags | None = DEFAULT_FLAGS,
+        flags: FileOperationFlags | int | None = DEFAULT_FLAGS,
         *,
         commit_on_exit: bool = False,
+        track_results: bool = True,
     ):
         """Create a FileOperator instance for managing file operations.  To be used with
         the `with` statement. Operations are scheduled first, then performed with the
@@ -130,49 +152,88 @@ class FileOperator:
 
         :param parent: A HANDLE to the window that should own any dialog boxes that are
             displayed. Also supports wx.Window instances.
-        :param flags: The FileOperationFlags to use for the operations.
+        :param flags: The FileOperationFlags to use for the operations. A plain int
+            of the same flags is also accepted.
         :param commit_on_exit: If True (default: False), `commit` will be performed
             automatically when the with block is exited if no exceptions were raised.
+        :param track_results: If True (default), a progress sink records the outcome
+            of each operation in `results`.  Pass False to skip a callback into
+            Python for every file processed, if you only need `aborted`.  In that
+            case `results` is empty and `return_code` is always 0 (S_OK), failures
+            are still raised from `commit`.
         """
-        self.entered = False
-        if parent is not None:
-            try:
-                parent = parent.GetHandle()  # wx.Window
-            except AttributeError:
-                pass
+        # The IFileOperation instance and progress sink, only present while inside the
+        # `with` block
+        self.ifo = None
+        self.sink = None
+        self.sink_cookie = None
+        # Destination folder IShellItems parsed during the `with` block, by path, and
+        # the bind context used to parse them
+        self._destinations = {}
+        self._bind_ctx = None
+        if hasattr(parent, 'GetHandle'):
+            parent = parent.GetHandle()  # wx.Window
         self._parent = parent
-        self._flags = flags
+        # Stored as a plain int, ready to hand to SetOperationFlags
+        self._flags = None if flags is None else int(flags)
         self.commit_on_exit = commit_on_exit
         self.results = {}
+        self._track_results = track_results
+
+    @property
+    def entered(self) -> bool:
+        """True while inside the `with` block."""
+        return self.ifo is not None
 
     @convert_exceptions
     def __enter__(self):
-        if self.entered:
+        if self.ifo is not None:
             raise IFileOperationError(f'{type(self).__name__} is not reentrant')
-        else:
-            self.entered = True
-            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
-            self.ifo = FileOperation()
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        self.ifo = FileOperation()
+        if self._track_results:
             self.sink = ProgressSink()
             self.sink_cookie = self.ifo.Advise(self.sink.com_ptr)
-            if self._parent is not None:
-                self.ifo.SetOwnerWindow(self._parent)
-            if self._flags is not None:
-                self.ifo.SetOperationFlags(int(self._flags))
-            self._operations_queued = False
-            return self
+        if self._parent is not None:
+            self.ifo.SetOwnerWindow(self._parent)
+        if self._flags is not None:
+            self.ifo.SetOperationFlags(self._flags)
+        self._operations_queued = False
+        return self
 
     @convert_exceptions
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        if self.commit_on_exit and not exc_type:
-            self.commit()
-            self.ifo.Unadvise(self.sink_cookie)
-        pythoncom.CoUninitialize()
-        # Delete the IFileOperation instance, so reentrance will raise an error
-        del self.ifo
-        del self.sink
-        del self.sink_cookie
-        self.entered = False
+        try:
+            if self.commit_on_exit and not exc_type:
+                self.commit()
+        finally:
+            try:
+                # Always unregister the sink, even if the block or commit raised
+                if self.sink_cookie is not None:
+                    self.ifo.Unadvise(self.sink_cookie)
+            finally:
+                # Release the COM objects before uninitializing COM
+                self._destinations.clear()
+                self._bind_ctx = None
+                self.ifo = None
+                self.sink = None
+                self.sink_cookie = None
+                pythoncom.CoUninitialize()
+
+    def _destination_item(self, destination: StrPath):
+        """Parse a destination directory into an IShellItem, reusing the item when the
+        same directory is used more than once in this `with` block.
+        """
+        path = abspath(destination)
+        try:
+            return self._destinations[path]
+        except KeyError:
+            if self._bind_ctx is None:
+                self._bind_ctx = folder_bind_ctx()
+            item = self._destinations[path] = filename_to_IShellItem(
+                path, True, self._bind_ctx
+            )
+            return item
 
     @convert_exceptions
     def move_file(
@@ -188,7 +249,7 @@ class FileOperator:
         """
         self.ifo.MoveItem(
             filename_to_IShellItem(source),
-            filename_to_IShellItem(destination, True),
+            self._destination_item(destination),
             new_name,
         )
         self._operations_queued = True
@@ -204,7 +265,7 @@ class FileOperator:
         srcs = filenames_to_IShellItemArray(sources)
         if not srcs:
             return
-        self.ifo.MoveItems(srcs, filename_to_IShellItem(destination, True))
+        self.ifo.MoveItems(srcs, self._destination_item(destination))
         self._operations_queued = True
 
     @convert_exceptions
@@ -221,19 +282,19 @@ class FileOperator:
         """
         if allow_move:
             # Check if new_name refers to a file in a different directory
-            dest_path = Path(new_name)
-            if len((dest_parts := dest_path.parts)) == 1:
+            dest_dir, dest_name = split(normpath(new_name))
+            if not dest_dir:
                 # No directory on the new_name, all good for a rename
                 pass
-            elif Path(source).parts[:-1] != dest_parts[:-1]:
+            elif dirname(normpath(source)) != dest_dir:
                 # new_name wants the file to be in a different directory, do a move
                 # instead
-                self.move_file(source, dest_path.parent, dest_path.name)
+                self.move_file(source, dest_dir, dest_name)
                 return
             else:
                 # new_name includes the directory, but it's the same directory, so a
                 # rename is fine
-                new_name = dest_path.name
+                new_name = dest_name
         self.ifo.RenameItem(filename_to_IShellItem(source), new_name)
         self._operations_queued = True
 
@@ -264,7 +325,7 @@ class FileOperator:
         """
         self.ifo.CopyItem(
             filename_to_IShellItem(source),
-            filename_to_IShellItem(destination, True),
+            self._destination_item(destination),
             new_name,
         )
         self._operations_queued = True
@@ -279,7 +340,7 @@ class FileOperator:
         srcs = filenames_to_IShellItemArray(sources)
         if not srcs:
             return
-        self.ifo.CopyItems(srcs, filename_to_IShellItem(destination, True))
+        self.ifo.CopyItems(srcs, self._destination_item(destination))
         self._operations_queued = True
 
     @convert_exceptions
@@ -309,18 +370,20 @@ class FileOperator:
 
     def commit(self):
         """Perform all scheduled file operations."""
-        try:
-            self._perform_operations()
-        except UnexpectedError:
-            if not self._operations_queued:
-                # Actually expected when no operations have been queued
+        if not self._operations_queued:
+            # PerformOperations fails with E_UNEXPECTED when nothing is queued, so
+            # don't bother calling it.
+            self.return_code = 0
+            self.aborted = False
+            self.results = {}
+            return
+        self._perform_operations()
+        self.aborted = self.ifo.GetAnyOperationsAborted()
+        if self.sink is None:
+            self.results = {}
+            if self.return_code is None:
                 self.return_code = 0
-                self.aborted = False
-                self.results = {}
-            else:
-                raise
         else:
-            self.aborted = self.ifo.GetAnyOperationsAborted()
             self.results = self.sink.name_map
             if self.return_code is None:
                 self.return_code = self.sink.result_code
@@ -30,3 +30,93 @@ def test_threading():
     futures = [executor.submit(worker, i) for i in range(50)]
     results = sorted(r.result() for r in as_completed(futures))
     assert results == list(range(50))
+
+def test_delete_results(tmp_path):
+    # Deleted files are recorded in the results
+    src = tmp_path / 'foo.txt'
+    src.write_text('foo')
+    op = FileOperator(flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True)
+    with op:
+        op.delete_file(src)
+    assert not src.exists()
+    assert op.results[str(src)] in ('DELETED', 'RECYCLE_BIN')
+
+def test_untracked_results(tmp_path):
+    # Operations still happen without a progress sink, but nothing is recorded
+    src = tmp_path / 'foo.txt'
+    src.write_text('foo')
+    dest = tmp_path / 'dest'
+    dest.mkdir()
+    op = FileOperator(
+        flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True, track_results=False
+    )
+    with op:
+        op.copy_file(src, dest)
+    assert op.results == {}
+    assert (dest / 'foo.txt').read_text() == 'foo'
+
+def test_copy_to_new_directory(tmp_path):
+    # Destinations that don't exist yet are parsed as folders and created
+    src = tmp_path / 'foo.txt'
+    src.write_text('foo')
+    dest = tmp_path / 'new_dir'
+    op = FileOperator(flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True)
+    with op:
+        op.copy_file(src, dest)
+    assert (dest / 'foo.txt').read_text() == 'foo'
+
+def test_exception_exit():
+    # Exiting through an exception cleans up, and the instance can be re-entered
+    op = FileOperator()
+    with pytest.raises(ValueError):
+        with op:
+            raise ValueError
+    assert not op.entered
+    with op:
+        assert op.entered
+    assert not op.entered
+
+@pytest.mark.parametrize(
+    'new_name',
+    ['bar.txt', './bar.txt', '{dir}/bar.txt'],
+    ids=['name', 'dot', 'full_path'],
+)
+def test_rename_same_directory(tmp_path, new_name):
+    # Names in the source's own directory are plain renames
+    src = tmp_path / 'foo.txt'
+    src.write_text('foo')
+    op = FileOperator(flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True)
+    with op:
+        op.rename_file(src, new_name.format(dir=tmp_path))
+    assert not src.exists()
+    assert (tmp_path / 'bar.txt').read_text() == 'foo'
+
+def test_rename_other_directory(tmp_path):
+    # Names in a different directory become a move
+    src = tmp_path / 'foo.txt'
+    src.write_text('foo')
+    other = tmp_path / 'other'
+    other.mkdir()
+    op = FileOperator(flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True)
+    with op:
+        op.rename_file(src, str(other / 'bar.txt'))
+    assert not src.exists()
+    assert not (tmp_path / 'bar.txt').exists()
+    assert (other / 'bar.txt').read_text() == 'foo'
+
+def test_copy_to_same_directory(tmp_path):
+    # The destination folder is parsed once per with block and reused
+    srcs = [tmp_path / 'foo.txt', tmp_path / 'bar.txt']
+    for src in srcs:
+        src.write_text(src.stem)
+    dest = tmp_path / 'new_dir'
+    op = FileOperator(flags=FileOperator.FULL_SILENT_FLAGS, commit_on_exit=True)
+    with op:
+        for src in srcs:
+            op.copy_file(src, dest)
+    # A new with block starts with an empty cache
+    with op:
+        op.move_file(srcs[0], dest, 'baz.txt')
+    assert (dest / 'foo.txt').read_text() == 'foo'
+    assert (dest / 'bar.txt').read_text() == 'bar'
+    assert (dest / 'baz.txt').read_text() == 'foo'